@@ -1,10 +1,11 @@
 """Creating a Data Repo for University"""
 
-from typing import Dict, DefaultDict, Tuple, List, Iterator
+from typing import Dict, Tuple, List, Iterator, Optional
 from prettytable import PrettyTable
-from collections import defaultdict
+from collections import Counter
+from itertools import chain
 import os
-import csv
+import sys
 # holds all of  the students, instructors and grades for a single University
 
 
@@ -17,8 +18,8 @@ class Repository:
         self._instructors: Dict[str, Instructor] = dict()
 
         try:
-            self._get_students(os.path.join(self._path, 'students.txt'))
-            self._get_instructors(os.path.join(self._path, 'instructors.txt'))
+            self._students = self._get_students(os.path.join(self._path, 'students.txt'))
+            self._instructors = self._get_instructors(os.path.join(self._path, 'instructors.txt'))
             self._get_grades(os.path.join(self._path, 'grades.txt'))
 
         except (FileNotFoundError, ValueError) as e:
@@ -31,54 +32,58 @@ class Repository:
                 print("\nInstructor Table ")
                 self.instructor_table()
 
-    def _get_students(self, path) -> None:
-        """ Read student details and added to dictionary """
-        for cwid, name, major in file_reader(path, 3, sep='\t', header=False):
-            self._students[cwid] = Student(cwid, name, major)
+    def _get_students(self, path) -> Dict[str, "Student"]:
+        """ Read student details and return them keyed by CWID """
+        return {cwid: Student(cwid, name, major)
+                for cwid, name, major in file_reader(path, 3, sep='\t', header=False)}
 
-    def _get_instructors(self, path) -> None:
-        """ Read Instructor's details and added to dictionary """
-        for cwid, name, dept in file_reader(path, 3, sep='\t', header=False):
-            self._instructors[cwid] = Instructor(cwid, name, dept)
+    def _get_instructors(self, path) -> Dict[str, "Instructor"]:
+        """ Read Instructor's details and return them keyed by CWID """
+        return {cwid: Instructor(cwid, name, dept)
+                for cwid, name, dept in file_reader(path, 3, sep='\t', header=False)}
 
     def _get_grades(self, path) -> None:
         """ Read grades and assigned to student and instructor """
-        for std_cwid, course, grade, instructor_cwid in file_reader(path, 4, sep='\t', header=False):
-            if std_cwid in self._students:
-                self._students[std_cwid].add_course(course, grade)
+        for std_cwid, course, grade, instructor_cwid in _iter_rows(path, 4, sep='\t', header=False):
+            course, grade = sys.intern(course), sys.intern(grade)
+
+            student: Optional[Student] = self._students.get(std_cwid)
+            if student is not None:
+                student.add_course(course, grade)
             else:
                 print(f'Grades for student is {std_cwid}')
 
-            if instructor_cwid in self._instructors:
-                self._instructors[instructor_cwid].add_student(course)
+            instructor: Optional[Instructor] = self._instructors.get(instructor_cwid)
+            if instructor is not None:
+                instructor.add_student(course)
             else:
                 print(f'Grades for instructor is {instructor_cwid}')
 
     def student_table(self) -> None:
         """ Student table """
         table = PrettyTable(field_names=Student.FIELD_NAMES)
-        for student in self._students.values():
-            table.add_row(student.info())
+        table.add_rows([student.info() for student in self._students.values()])
         # print(table)
 
     def instructor_table(self) -> None:
         """ Instructor table """
         table = PrettyTable(field_names=Instructor.FIELD_NAMES)
-        for instructor in self._instructors.values():
-            for row in instructor.info():
-                table.add_row(row)
+        table.add_rows(list(chain.from_iterable(
+            instructor.info() for instructor in self._instructors.values())))
         print(table)
 
 
 class Student:
     """Student Class to store student data"""
     FIELD_NAMES = ['CWID', 'Name', 'Completed Courses']
+    __slots__ = ('_cwid', '_name', '_major', '_courses', '_course_list')
 
     def __init__(self, cwid: str, name: str, major: str) -> None:
         self._cwid: str = cwid
         self._name: str = name
         self._major: str = major
         self._courses: Dict[str, str] = dict()
+        self._course_list: List[str] = list()
 
     def add_course(self, course: str, grade: str) -> None:
         """ Adding course with grade """
@@ -86,59 +91,85 @@ class Student:
 
     def info(self) -> Tuple[str, str, List[str]]:
         """ return a list of information needed for pretty table """
-        return [self._cwid, self._name, sorted(self._courses.keys())]
+        # courses are only ever added, so a new course always changes the count
+        if len(self._course_list) != len(self._courses):
+            self._course_list = sorted(self._courses)
+        return [self._cwid, self._name, list(self._course_list)]
 
 
 class Instructor:
     """ Instructor class """
     FIELD_NAMES = ['CWID', 'Name', 'Dept', 'Course', 'Students']
+    __slots__ = ('_cwid', '_name', '_dept', '_courses', '_pending')
 
     def __init__(self, cwid: str, name: str, dept: str) -> None:
 
         self._cwid: str = cwid
         self._name: str = name
         self._dept: str = dept
-        self._courses: DefaultDict[str, int] = defaultdict(int)
+        self._courses: Counter[str] = Counter()
+        self._pending: List[str] = list()
 
     def add_student(self, course: str) -> None:
-        """ Number of students taking course with Instructor """
-        self._courses[course] += 1
+        """ Record one student taking course with Instructor """
+        self._pending.append(course)
 
     def info(self) -> Iterator[Tuple[str, str, str, str, int]]:
         """ Yield row """
+        if self._pending:
+            # count the courses added since the last call in one pass
+            self._courses.update(self._pending)
+            self._pending.clear()
+
         for course, count in self._courses.items():
             yield [self._cwid, self._name, self._dept, course, count]
 
 
-def main():
-    Repository('/Users/malavshah/HW05_malav_shah/HW_09')
+def _read_lines(path: str) -> List[str]:
+    """ Read a whole text file and return its lines """
+
+    try:
+        file_path = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        raise FileNotFoundError("File is not present on the provided path")
 
+    else:
+        with file_path:
+            # universal newlines already map '\r\n' and '\r' to '\n'; splitlines() would
+            # also break on '\x85', '\u2028' and friends that can appear inside a field
+            lines: List[str] = file_path.read().split('\n')
 
-if __name__ == '__main__':
-    main()
+        if lines[-1] == '':
+            lines.pop()
+        return lines
+
+
+def _iter_rows(path: str, fields: int, sep: str = ',', header: bool = False) -> Iterator[List[str]]:
+    """ Read a text file and yield the validated fields of every line """
+
+    first_row: int = 2 if header else 1
+
+    for line_num, line in enumerate(_read_lines(path), 1):
+        parts: List[str] = line.split(sep, fields)
+
+        if len(parts) != fields:
+            raise ValueError(
+                f'{path} - path has length of line: {len(parts)} fields on line no: {line_num} expected {fields}')
+
+        # the header is validated like any other line, just not returned
+        if line_num >= first_row:
+            yield parts
 
 
 def file_reader(path: str, fields: int, sep: str = ',', header: bool = False) -> Iterator[Tuple[str]]:
     """ A generator function to read text files and return all of the values"""
 
-    try:
-        file_path = open(path, 'r')
-    except FileNotFoundError:
-        raise FileNotFoundError("File is not present on the provided path")
+    yield from (tuple(parts) for parts in _iter_rows(path, fields, sep, header))
 
-    else:
-        line_num: int = 0
-        with file_path:
-            reader = csv.reader(file_path, delimiter=sep)
 
-            for line in reader:
-                line_num += 1
+def main():
+    Repository('/Users/malavshah/HW05_malav_shah/HW_09')
 
-                if len(line) != fields:
-                    raise ValueError(
-                        f'{path} - path has length of line: {len(line)} fields on line no: {line_num} expected {fields}')
 
-                if header == False:
-                    yield tuple(line)
-                else:
-                    header = False
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,23 @@
 """" Test for Repository """
 
 import unittest
+import contextlib
+import io
 import os
-from HW09_Malav_Shah import Repository, Student, Instructor
+import tempfile
+from typing import List, Tuple
+from Student_Repository_Malav_Shah import Repository, Student, Instructor, file_reader
 
+TEST_PATH: str = "/Users/malavshah/HW_09"
 
+
+@unittest.skipUnless(os.path.isdir(TEST_PATH), "repository test data is not available")
 class TestRepository(unittest.TestCase):
     """ Test for repository """
 
     def setUp(self) -> None:
         """This methods allow you to define instructions that will be executed before and after each test method"""
-        self.test_path: str = "/Users/malavshah/HW_09"
+        self.test_path: str = TEST_PATH
         self.repo: Repository = Repository(self.test_path, False)
 
     def test_student_attributes(self) -> None:
@@ -50,6 +57,190 @@ class TestRepository(unittest.TestCase):
         self.assertEqual(expected, actual)
 
 
+class TestRepositoryFiles(unittest.TestCase):
+    """ Test for repository loaded from temporary data files """
+
+    def setUp(self) -> None:
+        """ Create a temporary directory for the data files """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write(self, name: str, text: str) -> None:
+        """ Write text to a data file in the temporary directory """
+        with open(os.path.join(self.tmp_dir.name, name), 'w', encoding='utf-8') as file:
+            file.write(text)
+
+    def load(self, grades: str, tables: bool = False) -> Tuple[Repository, str]:
+        """ Load a repository with fixed students and instructors and return it with its output """
+        self.write('students.txt', '10103\tBaldwin, C\tSFEN\n10115\tWyatt, X\tSFEN\n')
+        self.write('instructors.txt', '98765\tEinstein, A\tSFEN\n98764\tFeynman, R\tSFEN\n')
+        self.write('grades.txt', grades)
+        output: io.StringIO = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            repo: Repository = Repository(self.tmp_dir.name, tables)
+        return repo, output.getvalue()
+
+    def test_students_and_instructors(self) -> None:
+        """ Testing grades are assigned to students and instructors """
+        repo, output = self.load('10103\tSSW 567\tA\t98765\n'
+                                 '10103\tCS 501\tB\t98764\n'
+                                 '10115\tSSW 567\tA\t98765\n'
+                                 '10115\tSSW 564\tA-\t98764\n')
+
+        self.assertEqual(output, '')
+        self.assertEqual({cwid: student.info() for cwid, student in repo._students.items()},
+                         {'10103': ['10103', 'Baldwin, C', ['CS 501', 'SSW 567']],
+                          '10115': ['10115', 'Wyatt, X', ['SSW 564', 'SSW 567']]})
+        self.assertEqual({tuple(row) for instructor in repo._instructors.values() for row in instructor.info()},
+                         {('98765', 'Einstein, A', 'SFEN', 'SSW 567', 2),
+                          ('98764', 'Feynman, R', 'SFEN', 'CS 501', 1),
+                          ('98764', 'Feynman, R', 'SFEN', 'SSW 564', 1)})
+
+    def test_course_names_shared(self) -> None:
+        """ Testing students and instructors share one string per course """
+        repo, _ = self.load('10103\tSSW 567\tA\t98765\n10115\tSSW 567\tA\t98765\n')
+        courses: List[str] = [course for student in repo._students.values() for course in student.info()[2]]
+        courses += [row[3] for row in repo._instructors['98765'].info()]
+
+        self.assertEqual(len(courses), 3)
+        for course in courses:
+            self.assertIs(course, courses[0])
+
+    def test_unknown_cwids(self) -> None:
+        """ Testing grades for unknown students and instructors are reported """
+        repo, output = self.load('99999\tSSW 567\tA\t98765\n10103\tSSW 540\tA\t11111\n')
+
+        self.assertEqual(output, 'Grades for student is 99999\nGrades for instructor is 11111\n')
+        self.assertEqual(repo._students['10103'].info(), ['10103', 'Baldwin, C', ['SSW 540']])
+        self.assertEqual(list(repo._instructors['98765'].info()),
+                         [['98765', 'Einstein, A', 'SFEN', 'SSW 567', 1]])
+
+    def test_tables(self) -> None:
+        """ Testing the instructor table is printed """
+        _, output = self.load('10103\tSSW 567\tA\t98765\n', tables=True)
+
+        self.assertIn('Student Table', output)
+        self.assertIn('Instructor Table', output)
+        self.assertIn('| 98765 | Einstein, A | SFEN | SSW 567 |    1     |', output)
+
+    def test_grades_too_many_fields(self) -> None:
+        """ Testing grade rows with extra fields are rejected """
+        repo, output = self.load('10103\tSSW 540\tA\t98765\textra\n')
+
+        self.assertIn('line no: 1 expected 4', output)
+        self.assertEqual(repo._students['10103'].info(), ['10103', 'Baldwin, C', []])
+
+
+class TestStudent(unittest.TestCase):
+    """ Test for Student """
+
+    def test_info_sorted_courses(self) -> None:
+        """ Testing completed courses are sorted and listed once """
+        student: Student = Student('10103', 'Baldwin, C', 'SFEN')
+        for course, grade in (('SSW 567', 'A'), ('CS 501', 'B'), ('SSW 564', 'A-'), ('CS 501', 'A')):
+            student.add_course(course, grade)
+        self.assertEqual(student.info(),
+                         ['10103', 'Baldwin, C', ['CS 501', 'SSW 564', 'SSW 567']])
+
+    def test_info_returns_copy(self) -> None:
+        """ Testing changes to the returned course list do not leak into the student """
+        student: Student = Student('10103', 'Baldwin, C', 'SFEN')
+        student.add_course('SSW 567', 'A')
+        student.info()[2].append('CS 501')
+        self.assertEqual(student.info(), ['10103', 'Baldwin, C', ['SSW 567']])
+
+    def test_info_after_new_course(self) -> None:
+        """ Testing courses added after an earlier info call are listed """
+        student: Student = Student('10103', 'Baldwin, C', 'SFEN')
+        student.add_course('SSW 567', 'A')
+        self.assertEqual(student.info(), ['10103', 'Baldwin, C', ['SSW 567']])
+        student.add_course('CS 501', 'B')
+        self.assertEqual(student.info(), ['10103', 'Baldwin, C', ['CS 501', 'SSW 567']])
+
+
+class TestInstructor(unittest.TestCase):
+    """ Test for Instructor """
+
+    def test_info_counts_students(self) -> None:
+        """ Testing info counts students added before and after earlier calls """
+        instructor: Instructor = Instructor('98765', 'Einstein, A', 'SFEN')
+        instructor.add_student('SSW 567')
+        self.assertEqual(list(instructor.info()),
+                         [['98765', 'Einstein, A', 'SFEN', 'SSW 567', 1]])
+
+        instructor.add_student('SSW 567')
+        instructor.add_student('SSW 540')
+        self.assertEqual(list(instructor.info()),
+                         [['98765', 'Einstein, A', 'SFEN', 'SSW 567', 2],
+                          ['98765', 'Einstein, A', 'SFEN', 'SSW 540', 1]])
+        self.assertEqual(list(instructor.info()),
+                         [['98765', 'Einstein, A', 'SFEN', 'SSW 567', 2],
+                          ['98765', 'Einstein, A', 'SFEN', 'SSW 540', 1]])
+
+
+class TestFileReader(unittest.TestCase):
+    """ Test for file_reader """
+
+    def setUp(self) -> None:
+        """ Create a temporary directory for the input files """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write(self, text: str) -> str:
+        """ Write text to a temporary file and return its path """
+        path: str = os.path.join(self.tmp_dir.name, 'data.txt')
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            file.write(text)
+        return path
+
+    def test_rows(self) -> None:
+        """ Testing rows are split on the separator """
+        path: str = self.write('1\tA\tX\n2\tB\tY\n')
+        self.assertEqual(list(file_reader(path, 3, sep='\t')),
+                         [('1', 'A', 'X'), ('2', 'B', 'Y')])
+
+    def test_header(self) -> None:
+        """ Testing the header line is skipped """
+        path: str = self.write('cwid,name\n1,A\n2,B')
+        self.assertEqual(list(file_reader(path, 2, header=True)),
+                         [('1', 'A'), ('2', 'B')])
+
+    def test_bad_header(self) -> None:
+        """ Testing the header line is still checked for its field count """
+        path: str = self.write('cwid\n1,A\n')
+        with self.assertRaisesRegex(ValueError, 'line no: 1 expected 2'):
+            list(file_reader(path, 2, header=True))
+
+    def test_line_endings(self) -> None:
+        """ Testing only newlines end a line """
+        path: str = self.write('1,A\x85B\r\n2,C\u2028D\r\n')
+        self.assertEqual(list(file_reader(path, 2)),
+                         [('1', 'A\x85B'), ('2', 'C\u2028D')])
+
+    def test_too_few_fields(self) -> None:
+        """ Testing line numbers are reported for short lines """
+        path: str = self.write('cwid,name\n1,A\n2\n')
+        with self.assertRaisesRegex(ValueError, 'line no: 3 expected 2'):
+            list(file_reader(path, 2, header=True))
+
+    def test_too_many_fields(self) -> None:
+        """ Testing extra fields are rejected rather than merged into the last value """
+        path: str = self.write('1\tA\tX\n2\tB\tY\tZ\tW\n')
+        with self.assertRaisesRegex(ValueError, 'line no: 2 expected 3'):
+            list(file_reader(path, 3, sep='\t'))
+
+    def test_blank_line(self) -> None:
+        """ Testing blank lines are rejected """
+        path: str = self.write('1,A\n\n2,B\n')
+        with self.assertRaisesRegex(ValueError, 'line no: 2 expected 2'):
+            list(file_reader(path, 2))
+
+    def test_missing_file(self) -> None:
+        """ Testing a missing file raises FileNotFoundError """
+        with self.assertRaises(FileNotFoundError):
+            list(file_reader(os.path.join(self.tmp_dir.name, 'missing.txt'), 2))
+
+
 if __name__ == "__main__":
     """ Run test cases """
     unittest.main(exit=False, verbosity=2)